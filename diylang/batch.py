@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import sys
+import time
+from multiprocessing import Pool, get_start_method
+
+from .data import to_diy
+from .interpreter import STDLIB, interpret, load_stdlib, new_session
+from .types import DiyLangError, Environment
+
+"""
+This module evaluates lots of independent DIY Lang expressions in one go,
+reading them as JSON Lines and writing results the same way.
+
+    $ echo '{"id": 1, "source": "(+ x 1)", "bindings": {"x": 41}}' | \\
+          python -m diylang.batch
+    {"id": 1, "result": "42", "time": 3.1e-05}
+
+Each input line is a JSON object with the `source` of one expression, and
+optionally `bindings` of variables to JSON values and an `id` that is copied
+to the result. Each output line has either the unparsed `result` or an
+`error`, and the `time` in seconds spent on the record, including decoding
+it and converting its bindings. Results are written in the same order as the
+records were read.
+
+The standard library is loaded only once, and every record is evaluated in
+its own session environment, so definitions made by one record are never seen
+by the next. Errors in the standard library stop the batch before any records
+are evaluated.
+"""
+
+# The environment of a worker process, and the stdlib to load if it has none
+_env = None
+_stdlib = None
+
+
+def evaluate_record(line, env):
+    """Evaluate one JSONL record in a fresh session of `env`.
+    Returns the result record, ready to be serialized."""
+
+    start = time.perf_counter()
+    result = {}
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise DiyLangError("Record is not a JSON object")
+        if "id" in record:
+            result["id"] = record["id"]
+        if "source" not in record:
+            raise DiyLangError("Record has no source")
+        if not isinstance(record["source"], str):
+            raise DiyLangError("Record source is not a string")
+        bindings = record.get("bindings", {})
+        if not isinstance(bindings, dict):
+            raise DiyLangError("Record bindings are not a JSON object")
+
+        session = new_session(env)
+        for name, value in bindings.items():
+            session.bindings[name] = to_diy(value)
+        result["result"] = interpret(record["source"], session)
+    except Exception as e:
+        result["error"] = "%s: %s" % (e.__class__.__name__, e)
+    result["time"] = time.perf_counter() - start
+    return result
+
+
+def _load_env(stdlib):
+    return load_stdlib(stdlib, strict=True) if stdlib else Environment()
+
+
+def _init_worker(env, stdlib):
+    # Forked workers are handed the environment loaded by the parent process.
+    # Spawned ones get `env=None`, since closures can't be pickled, and load
+    # `stdlib` on their first record. Loading is kept out of the initializer,
+    # as a pool keeps replacing workers whose initializer raises.
+    global _env, _stdlib
+    _env = env
+    _stdlib = stdlib
+
+
+def _evaluate_in_worker(line):
+    global _env
+    if _env is None:
+        _env = _load_env(_stdlib)
+    return evaluate_record(line, _env)
+
+
+def run_batch(lines, stdlib=STDLIB, workers=1, chunk_size=100):
+    """Evaluate JSONL records, yielding result records in the same order.
+
+    With more than one worker, records are sent in chunks of `chunk_size`
+    to a pool of processes. Where processes are forked, they share the
+    environment loaded here. Elsewhere, each loads the `stdlib` file once.
+    Pass `stdlib=None` to evaluate records in an empty environment.
+    Errors loading `stdlib` are raised before any records are evaluated."""
+
+    lines = (line for line in lines if line.strip())
+    env = _load_env(stdlib)
+
+    if workers <= 1:
+        for line in lines:
+            yield evaluate_record(line, env)
+        return
+
+    shared = env if get_start_method() == "fork" else None
+    pool = Pool(workers, initializer=_init_worker, initargs=(shared, stdlib))
+    try:
+        for result in pool.imap(_evaluate_in_worker, lines, chunk_size):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Evaluate DIY Lang expressions from JSON Lines")
+    parser.add_argument("input", nargs="?", type=argparse.FileType("r"),
+                        default=sys.stdin,
+                        help="file with one record per line (default: stdin)")
+    parser.add_argument("--stdlib", default=STDLIB,
+                        help="file to load before evaluating any records")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=100,
+                        help="number of records sent to a worker at a time")
+    args = parser.parse_args(argv)
+
+    for result in run_batch(args.input, args.stdlib, args.workers,
+                            args.chunk_size):
+        sys.stdout.write(json.dumps(result) + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
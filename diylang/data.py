@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from .ast import is_boolean, is_integer, is_list, is_string, is_symbol
+from .types import DiyLangError, String
+
+"""
+This module converts data between Python and DIY Lang, so that structured
+data can be handed to the interpreter without first being written out as
+DIY Lang source and parsed.
+
+    > to_diy({"name": "diy", "tags": ["lisp", "toy"], "stars": 42})
+    [[String("name"), String("diy")],
+     [String("tags"), [String("lisp"), String("toy")]],
+     [String("stars"), 42]]
+
+JSON objects become association lists, that is, lists of (key value) pairs.
+The language has no floats and no null, so those are rejected.
+"""
+
+
+def to_diy(value):
+    """Convert Python data, as produced by the `json` module, to the
+    corresponding DIY Lang value."""
+
+    if isinstance(value, (bool, int)):
+        return value
+    elif isinstance(value, float):
+        if not value.is_integer():
+            raise DiyLangError("Cannot convert non-integer number: %s" % value)
+        return int(value)
+    elif isinstance(value, str):
+        return String(value)
+    elif isinstance(value, (list, tuple)):
+        return [to_diy(x) for x in value]
+    elif isinstance(value, dict):
+        return [[_to_diy_key(k), to_diy(v)] for k, v in value.items()]
+    else:
+        raise DiyLangError("Cannot convert to DIY Lang: %r" % (value,))
+
+
+def _to_diy_key(key):
+    if not isinstance(key, str):
+        raise DiyLangError("Cannot convert non-string key: %r" % (key,))
+    return String(key)
+
+
+def from_diy(value):
+    """Convert a DIY Lang value to plain Python data that can be serialized
+    by the `json` module. Strings and symbols both become Python strings."""
+
+    if is_boolean(value) or is_integer(value):
+        return value
+    elif is_string(value):
+        return value.val
+    elif is_symbol(value):
+        return value
+    elif is_list(value):
+        return [from_diy(x) for x in value]
+    else:
+        raise DiyLangError("Cannot convert to Python: %s" % (value,))
+
+
+def load_json(source):
+    """Parse a JSON document into a DIY Lang value"""
+
+    try:
+        data = json.loads(source)
+    except ValueError as e:
+        raise DiyLangError("Invalid JSON: %s" % e)
+    return to_diy(data)
+
+
+def dump_json(value):
+    """Serialize a DIY Lang value as a JSON document"""
+
+    return json.dumps(from_diy(value))
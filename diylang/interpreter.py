@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 
+from os.path import dirname, join
+
 from .evaluator import evaluate
 from .parser import parse, unparse, parse_multiple
-from .types import Environment
+from .types import Environment, DiyLangError
+
+STDLIB = join(dirname(dirname(__file__)), 'stdlib.diy')
 
 
 def interpret(source, env=None):
@@ -34,3 +38,30 @@ def interpret_file(filename, env=None):
     asts = parse_multiple(source)
     results = [evaluate(ast, env) for ast in asts]
     return unparse(results[-1])
+
+
+def load_stdlib(filename=STDLIB, strict=False):
+    """
+    Create an environment with the standard library loaded
+
+    Unless `strict` is set, errors from the standard library are ignored,
+    just like in the REPL. They will generally happen until part 6 is done
+    anyways.
+    """
+    env = Environment()
+    try:
+        interpret_file(filename, env)
+    except DiyLangError:
+        if strict:
+            raise
+    return env
+
+
+def new_session(env):
+    """
+    Create a session environment starting out with the bindings of `env`
+
+    Definitions made in the session environment do not affect `env`, so
+    a standard library only has to be loaded once for many sessions.
+    """
+    return Environment(dict(env.bindings))
@@ -62,26 +62,59 @@ def repl(env=None):
 def read_expression():
     """Read from stdin until we have at least one s-expression"""
 
-    exp = ""
-    open_parens = 0
+    pending = ExpressionBuffer()
     while True:
-        line, parens = read_line(">  " if not exp.strip() else "…  ")
-        open_parens += parens
-        exp += line
-        if exp.strip() and open_parens <= 0:
-            break
-
-    return exp.strip()
+        exp = pending.add(read_line("…  " if pending.started() else ">  "))
+        if exp is not None:
+            return exp
 
 
 def read_line(prompt):
-    """Return tuple of user input line and number of unclosed parens"""
+    """Return a line of user input"""
+
+    return input(colored(prompt, "reset", "dark"))
+
+
+def balance_line(line):
+    """Return tuple of line without comments and number of unclosed parens"""
 
-    line = input(colored(prompt, "reset", "dark"))
     line = remove_comments(line + "\n")
     return line, line.count("(") - line.count(")")
 
 
+class ExpressionBuffer(object):
+
+    """
+    Collects lines of input until they make up at least one s-expression.
+
+    Used both by the REPL and by the network server in `server.py`.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Throw away any partially read expression"""
+        self.exp = ""
+        self.open_parens = 0
+
+    def started(self):
+        return bool(self.exp.strip())
+
+    def add(self, line):
+        """Add a line of input. Returns the expression once its parens
+        balance, or None while more lines are needed."""
+        line, parens = balance_line(line)
+        self.open_parens += parens
+        self.exp += line
+        if not self.started() or self.open_parens > 0:
+            return None
+
+        exp = self.exp.strip()
+        self.reset()
+        return exp
+
+
 def colored(text, color, attr=None):
     attributes = {
         'bold': 1,
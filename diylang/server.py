@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from .interpreter import interpret, load_stdlib, new_session
+from .repl import ExpressionBuffer
+
+"""
+This module holds a network version of the REPL, for when you'd like to let
+more than one person at a time play with your language.
+
+    $ python -m diylang.server --port 4242
+    $ nc localhost 4242
+    (define answer 42)
+    answer
+    (+ answer 1)
+    43
+
+Clients send expressions the same way they would type them into the REPL.
+Once the parens of an expression balance, it is evaluated, and the result is
+sent back on a single line. Errors are sent back on a single line starting
+with `!`.
+
+Every client gets its own session environment, which starts out as a copy of
+the bindings of a shared environment with the standard library loaded.
+Definitions made by one client are thus never seen by the others.
+
+Evaluation happens in a pool of worker threads, so that one slow expression
+never stops the server from talking to the other clients.
+"""
+
+
+async def discard_line(reader):
+    """Skip past the rest of the current line, however long it is"""
+
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.IncompleteReadError:
+            return
+        except asyncio.LimitOverrunError as e:
+            await reader.readexactly(e.consumed)
+
+
+class Server(object):
+
+    def __init__(self, env=None, workers=4):
+        self.env = env if env is not None else load_stdlib()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    async def start(self, host="localhost", port=4242, path=None):
+        """Start listening on a TCP port, or on a Unix socket if `path` is
+        given. Returns the `asyncio` server object."""
+
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path=path)
+        return await asyncio.start_server(self.handle, host, port)
+
+    def respond(self, source, env):
+        """Interpret source, returning the single line to send to the client.
+        Called from the worker threads."""
+
+        try:
+            response = interpret(source, env)
+        except Exception as e:
+            response = "! %s: %s" % (e.__class__.__name__, e)
+        return " ".join(response.splitlines())
+
+    async def handle(self, reader, writer):
+        """Run one client session until the client disconnects"""
+
+        loop = asyncio.get_running_loop()
+        env = new_session(self.env)
+        pending = ExpressionBuffer()
+        try:
+            while True:
+                try:
+                    data = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    data = e.partial
+                except asyncio.LimitOverrunError:
+                    # Lines longer than the reader limit (64 KiB by default)
+                    # are dropped along with the expression they are part of.
+                    await discard_line(reader)
+                    pending.reset()
+                    writer.write(b"! Line too long, expression discarded\n")
+                    await writer.drain()
+                    continue
+                if not data:
+                    break
+                line = data.decode("utf-8", "replace").rstrip("\r\n")
+                source = pending.add(line)
+                if source is None:
+                    continue
+
+                response = await loop.run_in_executor(
+                    self.executor, self.respond, source, env)
+                writer.write((response + "\n").encode("utf-8"))
+                await writer.drain()
+        except ConnectionError:
+            # The client hung up before we got to answer, nothing to do.
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+
+async def serve(server, host, port, path):
+    listener = await server.start(host, port, path)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DIY Lang REPL server")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=4242)
+    parser.add_argument("--unix", metavar="PATH",
+                        help="listen on a Unix socket instead of a TCP port")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="number of threads evaluating expressions")
+    args = parser.parse_args(argv)
+
+    server = Server(workers=args.workers)
+    try:
+        asyncio.run(serve(server, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ set nosetests=call python -W ignore::DeprecationWarning -m nose
 
 %nosetests% ^
 tests/test_provided_code.py ^
+tests/test_data.py ^
 tests/test_1_parsing.py ^
 tests/test_2_evaluating_simple_expressions.py ^
 tests/test_3_evaluating_complex_expressions.py ^
@@ -14,4 +15,6 @@ tests/test_6_working_with_lists.py ^
 tests/test_7_using_the_language.py ^
 tests/test_8_final_touches.py ^
 tests/test_sanity_checks.py ^
+tests/test_server.py ^
+tests/test_batch.py ^
 --stop
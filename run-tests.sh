@@ -7,6 +7,7 @@
 function run_tests {
     nosetests \
         tests/test_provided_code.py \
+        tests/test_data.py \
         tests/test_1_parsing.py \
         tests/test_2_evaluating_simple_expressions.py \
         tests/test_3_evaluating_complex_expressions.py \
@@ -16,6 +17,8 @@ function run_tests {
         tests/test_7_using_the_language.py \
         tests/test_8_final_touches.py \
         tests/test_sanity_checks.py \
+        tests/test_server.py \
+        tests/test_batch.py \
         --stop
 }
 
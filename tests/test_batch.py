@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+from multiprocessing import get_context
+
+from nose.tools import assert_equals, assert_true, assert_in, \
+    assert_raises
+
+from diylang.batch import run_batch, _init_worker, _evaluate_in_worker
+from diylang.types import DiyLangError
+
+"""
+Tests for the JSON Lines batch mode in `batch.py`.
+
+Like the sanity checks, these tests are intended to run after you have
+completed the core of the language.
+"""
+
+
+def batch(records, **kwargs):
+    lines = [json.dumps(record) for record in records]
+    return list(run_batch(lines, **kwargs))
+
+
+def test_records_are_evaluated_in_order():
+    results = batch([{"id": "a", "source": "(+ 1 2)"},
+                     {"id": "b", "source": "'(foo bar)"}], stdlib=None)
+
+    assert_equals(["a", "b"], [r["id"] for r in results])
+    assert_equals(["3", "(foo bar)"], [r["result"] for r in results])
+    assert_true(all(r["time"] >= 0 for r in results))
+
+
+def test_bindings_are_converted_from_json():
+    results = batch([{"source": "(if flag (head xs) name)",
+                      "bindings": {"flag": True, "xs": [1, 2], "name": "x"}}],
+                    stdlib=None)
+    assert_equals("1", results[0]["result"])
+
+
+def test_errors_are_reported_per_record():
+    results = batch([{"source": "my-missing-var"}, {"id": 2}, {"source": "1"}],
+                    stdlib=None)
+
+    assert_true(results[0]["error"].startswith("DiyLangError: "))
+    assert_equals("DiyLangError: Record has no source", results[1]["error"])
+    assert_equals("1", results[2]["result"])
+
+
+def test_invalid_json_is_reported_as_error():
+    results = list(run_batch(['{"source": '], stdlib=None))
+    assert_in("error", results[0])
+
+
+def test_records_are_isolated_from_each_other():
+    results = batch([{"source": "(define x 1)"}, {"source": "x"}],
+                    stdlib=None)
+
+    assert_equals("x", results[0]["result"])
+    assert_in("error", results[1])
+
+
+def test_stdlib_is_available_in_worker_processes():
+    with tempfile.NamedTemporaryFile("w", suffix=".diy", delete=False) as f:
+        f.write("(define answer 42)")
+    try:
+        records = [{"id": n, "source": "(+ answer %d)" % n}
+                   for n in range(10)]
+        results = batch(records, stdlib=f.name, workers=2, chunk_size=3)
+    finally:
+        os.remove(f.name)
+
+    assert_equals(list(range(10)), [r["id"] for r in results])
+    assert_equals([str(42 + n) for n in range(10)],
+                  [r["result"] for r in results])
+
+
+def test_stdlib_errors_are_raised_instead_of_hanging():
+    with assert_raises(IOError):
+        batch([{"source": "1"}], stdlib="/nonexistent.diy", workers=2)
+
+
+def test_batches_with_different_stdlibs_do_not_interfere():
+    with tempfile.NamedTemporaryFile("w", suffix=".diy", delete=False) as f:
+        f.write("(define answer 42)")
+    try:
+        with_stdlib = run_batch(['{"source": "answer"}'] * 2, stdlib=f.name)
+        without_stdlib = run_batch(['{"source": "answer"}'], stdlib=None)
+
+        assert_equals("42", next(with_stdlib)["result"])
+        assert_in("error", next(without_stdlib))
+        assert_equals("42", next(with_stdlib)["result"])
+    finally:
+        os.remove(f.name)
+
+
+def test_stdlib_evaluation_errors_are_raised():
+    with tempfile.NamedTemporaryFile("w", suffix=".diy", delete=False) as f:
+        f.write("(define a 1) (undefined-fn 2) (define answer 42)")
+    try:
+        for workers in [1, 2]:
+            with assert_raises(DiyLangError):
+                batch([{"source": "answer"}], stdlib=f.name, workers=workers)
+    finally:
+        os.remove(f.name)
+
+
+def test_spawned_workers_raise_stdlib_errors():
+    pool = get_context("spawn").Pool(
+        1, initializer=_init_worker, initargs=(None, "/nonexistent.diy"))
+    try:
+        with assert_raises(IOError):
+            pool.apply(_evaluate_in_worker, ['{"source": "1"}'])
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def test_records_of_wrong_shape_are_reported_as_errors():
+    results = list(run_batch(['42',
+                              '{"source": 42}',
+                              '{"source": "1", "bindings": [1]}'],
+                             stdlib=None))
+
+    assert_equals(["DiyLangError: Record is not a JSON object",
+                   "DiyLangError: Record source is not a string",
+                   "DiyLangError: Record bindings are not a JSON object"],
+                  [r["error"] for r in results])
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from nose.tools import assert_equals, assert_raises_regexp
+
+from diylang.data import to_diy, from_diy, load_json, dump_json
+from diylang.parser import unparse
+from diylang.types import DiyLangError, String
+
+"""
+Tests for converting data between Python and DIY Lang in `data.py`.
+Like the tests for the provided code, these should already pass.
+"""
+
+
+def test_to_diy_atoms():
+    assert_equals(42, to_diy(42))
+    assert_equals(True, to_diy(True))
+    assert_equals(False, to_diy(False))
+    assert_equals(String("foo"), to_diy("foo"))
+
+
+def test_to_diy_integral_floats():
+    assert_equals(3, to_diy(3.0))
+
+    with assert_raises_regexp(DiyLangError, "non-integer"):
+        to_diy(3.5)
+
+
+def test_to_diy_lists():
+    assert_equals([1, [String("a"), False], []], to_diy([1, ["a", False], []]))
+
+
+def test_to_diy_objects_become_association_lists():
+    assert_equals([[String("a"), 1], [String("b"), [2, 3]]],
+                  to_diy({"a": 1, "b": [2, 3]}))
+
+
+def test_to_diy_rejects_non_string_keys():
+    with assert_raises_regexp(DiyLangError, "non-string key: 1"):
+        to_diy({1: 2})
+
+
+def test_to_diy_rejects_null():
+    with assert_raises_regexp(DiyLangError, "Cannot convert"):
+        to_diy(None)
+
+
+def test_from_diy():
+    assert_equals([1, "foo", "bar", [True, False]],
+                  from_diy([1, String("foo"), "bar", [True, False]]))
+
+
+def test_load_json():
+    value = load_json('{"tags": ["lisp", "toy"], "stars": 42, "fun": true}')
+    assert_equals('(("tags" ("lisp" "toy")) ("stars" 42) ("fun" #t))',
+                  unparse(value))
+
+
+def test_load_invalid_json():
+    with assert_raises_regexp(DiyLangError, "Invalid JSON"):
+        load_json('[1, 2')
+
+
+def test_dump_json():
+    assert_equals('[1, "foo", [true, false]]',
+                  dump_json([1, String("foo"), [True, False]]))
+
+
+def test_from_diy_rejects_other_values():
+    with assert_raises_regexp(DiyLangError, r"to Python: \(1, 2\)"):
+        from_diy((1, 2))
@@ -3,6 +3,7 @@
 from nose.tools import assert_equals, assert_raises_regexp, assert_raises
 
 from diylang.parser import unparse, find_matching_paren
+from diylang.repl import balance_line, ExpressionBuffer
 from diylang.types import DiyLangError
 
 """
@@ -89,3 +90,40 @@ def test_unparse_other_quotes():
 
 def test_unparse_empty_list():
     assert_equals("()", unparse([]))
+
+# Tests for balance_line in repl.py
+
+
+def test_balance_line_counts_unclosed_parens():
+    assert_equals(("(foo (bar\n", 2), balance_line("(foo (bar"))
+    assert_equals(("baz))\n", -2), balance_line("baz))"))
+    assert_equals(("42\n", 0), balance_line("42"))
+
+
+def test_balance_line_ignores_parens_in_comments():
+    assert_equals(("(foo \n", 1), balance_line("(foo ; (bar)))"))
+
+
+# Tests for ExpressionBuffer in repl.py
+
+
+def test_expression_buffer_waits_for_parens_to_balance():
+    pending = ExpressionBuffer()
+    assert_equals(None, pending.add("(define x"))
+    assert_equals(True, pending.started())
+    assert_equals(None, pending.add("  ; the answer (obviously)"))
+    assert_equals("(define x\n  \n  42)", pending.add("  42)"))
+    assert_equals(False, pending.started())
+
+
+def test_expression_buffer_skips_blank_lines():
+    pending = ExpressionBuffer()
+    assert_equals(None, pending.add("   "))
+    assert_equals("foo", pending.add("foo"))
+
+
+def test_expression_buffer_reset_discards_partial_expression():
+    pending = ExpressionBuffer()
+    pending.add("(foo (bar")
+    pending.reset()
+    assert_equals("baz", pending.add("baz"))
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import shutil
+import socket
+import tempfile
+import threading
+
+from nose.plugins.skip import SkipTest
+from nose.tools import assert_equals, assert_true, assert_false
+
+from diylang.interpreter import interpret
+from diylang.server import Server
+from diylang.types import Environment
+
+"""
+Tests for the network REPL in `server.py`.
+
+Like the sanity checks, these tests are intended to run after you have
+completed the core of the language, except for the ones using
+`EchoServer`. Everything runs on localhost.
+"""
+
+
+class EchoServer(Server):
+
+    """Server answering with the expressions it is sent, without evaluating
+    them. Answering `slow` is put off until `release` is set."""
+
+    def __init__(self):
+        Server.__init__(self, Environment())
+        self.release = threading.Event()
+
+    def respond(self, source, env):
+        if source == "slow":
+            self.release.wait(10)
+        return " ".join(source.split())
+
+
+def talk(server, *sessions, **kwargs):
+    """Start the server on a free port, and run each session in turn.
+
+    A session is a list of lines, as strings or bytes, to send. Returns the
+    responses received by each session, one for every complete expression
+    sent. Pass `path` to talk over a Unix socket instead."""
+
+    path = kwargs.get("path")
+
+    async def connect(port):
+        if path is not None:
+            return await asyncio.open_unix_connection(path)
+        return await asyncio.open_connection("localhost", port)
+
+    async def run():
+        listener = await server.start("localhost", 0, path)
+        port = None if path else listener.sockets[0].getsockname()[1]
+        responses = []
+        for lines in sessions:
+            reader, writer = await connect(port)
+            for line in lines:
+                if not isinstance(line, bytes):
+                    line = line.encode("utf-8")
+                writer.write(line + b"\n")
+            writer.write_eof()
+            data = await reader.read()
+            responses.append(data.decode("utf-8").splitlines())
+            writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return responses
+
+    try:
+        return asyncio.run(run())
+    finally:
+        server.close()
+
+
+def test_expressions_are_evaluated_one_by_one():
+    responses = talk(Server(Environment()),
+                     ["(define x 40)", "(+ x 2)"])
+    assert_equals([["x", "42"]], responses)
+
+
+def test_expressions_may_span_several_lines():
+    responses = talk(Server(Environment()),
+                     ["(define x", "    ; comments work too :)", "  42)", "x"])
+    assert_equals([["x", "42"]], responses)
+
+
+def test_errors_are_reported_on_a_single_line():
+    responses = talk(Server(Environment()), ["my-missing-var", "1"])
+    [[error, result]] = responses
+    assert_true(error.startswith("! DiyLangError: "))
+    assert_equals("1", result)
+
+
+def test_sessions_start_from_shared_environment():
+    env = Environment()
+    interpret("(define answer 42)", env)
+
+    responses = talk(Server(env), ["answer"], ["answer"])
+    assert_equals([["42"], ["42"]], responses)
+
+
+def test_sessions_do_not_see_each_others_definitions():
+    env = Environment()
+    responses = talk(Server(env), ["(define foo 1)", "foo"], ["foo"])
+
+    assert_equals(["foo", "1"], responses[0])
+    assert_true(responses[1][0].startswith("! DiyLangError: "))
+    assert_equals({}, env.bindings)
+
+
+def test_invalid_utf8_is_reported_as_error():
+    responses = talk(Server(Environment()), [b"\xff\xfe", "1"])
+    [[error, result]] = responses
+    assert_true(error.startswith("! "))
+    assert_equals("1", result)
+
+
+def test_too_long_lines_are_reported_as_error():
+    too_long = " " * 100000 + "1)"
+    responses = talk(Server(Environment()), ["(+ 1", too_long, "(+ 1", "1)"])
+    assert_equals([["! Line too long, expression discarded", "2"]],
+                  responses)
+
+
+def test_slow_expressions_do_not_block_other_clients():
+    server = EchoServer()
+
+    async def ask(port, source):
+        reader, writer = await asyncio.open_connection("localhost", port)
+        writer.write((source + "\n").encode("utf-8"))
+        answer = await reader.readline()
+        writer.close()
+        return answer.decode("utf-8").strip()
+
+    async def run():
+        listener = await server.start("localhost", 0)
+        port = listener.sockets[0].getsockname()[1]
+
+        slow = asyncio.ensure_future(ask(port, "slow"))
+        sources = ["(fast %d)" % n for n in range(20)]
+        fast = await asyncio.wait_for(
+            asyncio.gather(*[ask(port, source) for source in sources]), 5)
+        assert_equals(sources, fast)
+        assert_false(slow.done())
+
+        server.release.set()
+        assert_equals("slow", await asyncio.wait_for(slow, 5))
+
+        listener.close()
+        await listener.wait_closed()
+
+    try:
+        asyncio.run(run())
+    finally:
+        server.release.set()
+        server.close()
+
+
+def test_serving_on_unix_socket():
+    if not hasattr(socket, "AF_UNIX"):
+        raise SkipTest("Unix sockets are not supported on this platform")
+
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, "diy.sock")
+        responses = talk(EchoServer(), ["(foo", "  bar)", "baz"], path=path)
+    finally:
+        shutil.rmtree(tmp)
+
+    assert_equals([["(foo bar)", "baz"]], responses)